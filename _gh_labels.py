@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Issue/PR 作成スクリプト共通のラベル事前解決.
+
+Issue 側が参照するラベルのうちリポジトリに存在しないものを起動時に
+createLabel でまとめて作っておく。これで作成ループが「ラベルなしで
+リトライ」する分岐に入らなくなる。解決済みのラベル名は
+.gh_label_cache.json にリポジトリ単位で保存し、再実行時は鮮度が
+保たれていれば createLabel の往復を丸ごと飛ばす。
+"""
+
+import json
+import time
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+CACHE_FILE = ".gh_label_cache.json"
+CACHE_TTL = 24 * 60 * 60  # 1 日
+DEFAULT_COLOR = "ededed"
+
+CREATE_LABEL_MUTATION = """
+mutation($input: CreateLabelInput!) {
+  createLabel(input: $input) { label { id name } }
+}
+"""
+
+
+def _load_cached_names(repo_key):
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    entry = cache.get(repo_key)
+    if not entry or time.time() - entry.get("fetched_at", 0) > CACHE_TTL:
+        return None
+    return set(entry.get("names", []))
+
+
+def _save_cached_names(repo_key, names):
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    cache[repo_key] = {"fetched_at": time.time(), "names": sorted(names)}
+    with open(CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2)
+
+
+def ensure_labels(client, repo_id, label_nodes, wanted, repo_key):
+    """wanted のうち存在しないラベルを作成し、name → id の辞書を返す.
+
+    呼び出し側は Issue ごとに nodes リストを走査する代わりに
+    この辞書を引くだけでよい。client は Authorization ヘッダ設定済みの
+    httpx.Client。
+    """
+    known = {n["name"] for n in label_nodes}
+    cached = _load_cached_names(repo_key)
+    if cached is not None and wanted <= cached:
+        return {n["name"]: n["id"] for n in label_nodes}
+
+    for name in sorted(wanted - known):
+        resp = client.post(GRAPHQL_URL, json={
+            "query": CREATE_LABEL_MUTATION,
+            "variables": {"input": {
+                "repositoryId": repo_id,
+                "name": name,
+                "color": DEFAULT_COLOR,
+            }},
+        })
+        resp.raise_for_status()
+        payload = resp.json()
+        if payload.get("errors"):
+            print(f"  Label create failed for '{name}': {payload['errors']}")
+            continue
+        label_nodes.append(payload["data"]["createLabel"]["label"])
+        known.add(name)
+
+    # 作成に失敗したラベルをキャッシュに入れると次回以降スキップされて
+    # しまうので、実在が確認できた known だけを保存する
+    _save_cached_names(repo_key, known)
+    return {n["name"]: n["id"] for n in label_nodes}
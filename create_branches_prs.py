@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""issues_v2.json の各 Issue に対応する作業ブランチと draft PR を作る.
+
+ブランチ作成は checkout を一切使わず plumbing で行う: main の tree に
+commit-tree で空コミットを積み、ref の張り替えは 1 本の
+git update-ref --stdin にまとめて流す (worktree にも触らない)。
+push は refspec を並べて 1 回の git push にまとめ (TLS ハンドシェイクと
+pack 交渉も 1 回で済む)、PR 作成は ThreadPoolExecutor で並列化する。
+PR 作成は gh CLI ではなく GraphQL の createPullRequest を 1 本の
+httpx クライアントで直接叩き、ラベルは addLabelsToLabelable で後付けする。
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from _gh_labels import ensure_labels
+from _issues_loader import load_issues
+
+OWNER = "rebuildup"
+REPO = "pomodoroom"
+GRAPHQL_URL = "https://api.github.com/graphql"
+PULLS_URL = f"https://api.github.com/repos/{OWNER}/{REPO}/pulls"
+ISSUE_START_NUMBER = 219
+MAX_WORKERS = 4  # fd 枯渇 (EAGAIN) を避けるため上限 4 に固定
+
+REPO_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100) { nodes { id name } }
+  }
+}
+"""
+
+PR_CREATE_MUTATION = """
+mutation($input: CreatePullRequestInput!) {
+  createPullRequest(input: $input) { pullRequest { id number url } }
+}
+"""
+
+ADD_LABELS_MUTATION = """
+mutation($input: AddLabelsToLabelableInput!) {
+  addLabelsToLabelable(input: $input) { clientMutationId }
+}
+"""
+
+# ブランチ名 → 対応する Issue 番号
+BRANCH_MAP = {
+    "feature/phase0-1-timer-pause-resume-drift": 219,
+    "feature/phase0-2-config-validation-errors": 220,
+    "feature/phase0-3-sqlite-migration-rollback": 221,
+    "feature/phase0-4-wait-to-active-transition": 222,
+    "feature/phase0-5-minitimer-rerender-flicker": 223,
+    "feature/phase0-6-tray-pressure-mode-toggle": 224,
+    "feature/phase1-1-keyring-token-refresh": 225,
+    "feature/phase1-2-focus-window-cache": 226,
+    "feature/phase1-3-scoring-pressure-term": 227,
+    "feature/phase1-4-schedule-list-json": 228,
+    "feature/phase1-5-stats-weekly-chart": 229,
+    "feature/phase1-6-tuner-prior-config": 230,
+    "feature/phase2-1-guidance-card-reorder": 231,
+    "feature/phase2-2-timeline-virtual-scroll": 232,
+    "feature/phase2-3-native-notifications": 233,
+    "feature/phase2-4-task-split-subcommand": 234,
+    "feature/phase2-5-sync-conflict-policy": 235,
+    "feature/phase2-6-offline-sync-queue": 236,
+}
+
+# spec が壊れているときは issues_v2.json を読む前 (import 時) に落とす
+assert len(BRANCH_MAP) == 18, f"BRANCH_MAP has {len(BRANCH_MAP)} entries, expected 18"
+assert isinstance(ISSUE_START_NUMBER, int)
+
+
+def run(cmd, check=True, capture=False, input=None):
+    """subprocess.run の薄いラッパ.
+
+    stdout を使わない呼び出しがほとんどなので、既定ではパイプを stderr の
+    1 本だけにして stdout は DEVNULL に落とす (パイプ割り当てとデコードを
+    半減)。出力を読む呼び出しだけ capture=True を渡す。
+    """
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        input=input,
+    )
+    if check and result.returncode != 0:
+        print(f"  Command failed: {' '.join(cmd)}", file=sys.stderr)
+        print(f"  stderr: {result.stderr.strip()}", file=sys.stderr)
+    return result
+
+
+def gql(client, query, variables):
+    resp = client.post(GRAPHQL_URL, json={"query": query, "variables": variables})
+    resp.raise_for_status()
+    payload = resp.json()
+    if payload.get("errors"):
+        return None, payload["errors"]
+    return payload["data"], None
+
+
+def open_pr_heads(client):
+    """open な PR の head ブランチ名を起動時に 1 回だけ集める.
+
+    再実行時はこの集合との突き合わせだけでブランチごとの処理を
+    丸ごとスキップできる。
+    """
+    heads = set()
+    page = 1
+    while True:
+        resp = client.get(
+            PULLS_URL, params={"state": "open", "per_page": 100, "page": page}
+        )
+        resp.raise_for_status()
+        batch = resp.json()
+        heads.update(pr["head"]["ref"] for pr in batch)
+        if len(batch) < 100:
+            return heads
+        page += 1
+
+
+def create_branches(branch_specs):
+    """checkout せずに plumbing で全ブランチを一括作成する.
+
+    main の tree を指す空コミットをブランチごとに commit-tree で作り、
+    ref の張り替えは 1 本の git update-ref --stdin にまとめる。
+    既存ブランチは update で上書きされるので branch -D も不要。
+    """
+    main_sha = run(["git", "rev-parse", "main"], capture=True).stdout.strip()
+    main_tree = run(["git", "rev-parse", "main^{tree}"], capture=True).stdout.strip()
+    if not main_sha or not main_tree:
+        return False
+
+    updates = []
+    for branch, issue_num in branch_specs:
+        result = run([
+            "git", "commit-tree", main_tree, "-p", main_sha,
+            "-m", f"chore: start work for #{issue_num}",
+        ], capture=True)
+        if result.returncode != 0:
+            return False
+        updates.append(f"update refs/heads/{branch} {result.stdout.strip()}\n")
+
+    result = run(["git", "update-ref", "--stdin"], input="".join(updates))
+    return result.returncode == 0
+
+
+def create_pr(client, repo_id, branch, title, body):
+    data, errors = gql(client, PR_CREATE_MUTATION, {
+        "input": {
+            "repositoryId": repo_id,
+            "baseRefName": "main",
+            "headRefName": branch,
+            "title": title,
+            "body": body,
+            "draft": True,
+        }
+    })
+    if errors:
+        print(f"  PR creation failed: {errors}", file=sys.stderr)
+        return None
+    return data["createPullRequest"]["pullRequest"]
+
+
+def add_labels(client, pr_id, label_ids):
+    _, errors = gql(client, ADD_LABELS_MUTATION, {
+        "input": {"labelableId": pr_id, "labelIds": label_ids}
+    })
+    if errors:
+        # ラベルは後から手で付けられるので PR を作り直さずログだけ残す
+        print(f"  Label attach failed: {errors}", file=sys.stderr)
+
+
+def push_branches(branches):
+    """全ブランチの push を 1 回の git push にまとめる.
+
+    個別に弾かれた ref があれば stderr から拾って返す。push 自体が
+    失敗した (どの ref も特定できない) 場合は None を返す。
+    """
+    refspecs = [f"{b}:{b}" for b in branches]
+    result = run(["git", "push", "-u", "origin", *refspecs], check=False)
+    if result.returncode == 0:
+        return set()
+    failed = set()
+    for line in result.stderr.splitlines():
+        # " ! [rejected]  src -> dst (reason)" 形式の行から src を拾う
+        parts = line.split()
+        if parts and parts[0] == "!" and len(parts) >= 3:
+            failed.add(parts[2].split(":")[0])
+    if not failed:
+        print(f"  Push failed: {result.stderr.strip()}", file=sys.stderr)
+        return None
+    return failed
+
+
+def create_pr_with_labels(client, repo_id, branch, title, pr_body, label_ids):
+    """createPullRequest + ラベル付け。phase 2 のワーカーから呼ばれる."""
+    pr = create_pr(client, repo_id, branch, title, pr_body)
+    if pr is None:
+        return None
+    if label_ids:
+        add_labels(client, pr["id"], label_ids)
+    print(f"  PR #{pr['number']} ({branch}): {pr['url']}")
+    return pr
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create branches and draft PRs")
+    parser.add_argument("--dry-run", action="store_true", help="実行せずに内容だけ表示する")
+    args = parser.parse_args()
+
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if not token and not args.dry_run:
+        print("Error: GH_TOKEN が設定されていない", file=sys.stderr)
+        sys.exit(1)
+
+    issues = load_issues()
+    assert len(issues) == len(BRANCH_MAP), (
+        f"issues_v2.json has {len(issues)} entries but BRANCH_MAP has {len(BRANCH_MAP)}"
+    )
+
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+    }
+    created = 0
+    with httpx.Client(http2=True, headers=headers, timeout=30.0) as client:
+        repo_id = None
+        label_name_to_id = {}
+        open_heads = set()
+        if not args.dry_run:
+            data, errors = gql(client, REPO_QUERY, {"owner": OWNER, "name": REPO})
+            if errors:
+                print(f"Error: repository lookup failed: {errors}", file=sys.stderr)
+                sys.exit(1)
+            repo_id = data["repository"]["id"]
+            label_nodes = data["repository"]["labels"]["nodes"]
+            wanted = {l for issue in issues for l in issue.get("labels", [])}
+            label_name_to_id = ensure_labels(
+                client, repo_id, label_nodes, wanted, f"{OWNER}/{REPO}"
+            )
+            open_heads = open_pr_heads(client)
+
+        # Phase 1: 全ブランチを plumbing で一括作成 (worktree に触らない)
+        pending = []
+        branch_specs = []
+        for issue, (branch, issue_num) in zip(issues, BRANCH_MAP.items()):
+            title = f"[#{issue_num}] {issue['title']}"
+
+            if args.dry_run:
+                print(f"[dry-run] {branch} -> PR '{title}'")
+                continue
+
+            if branch in open_heads:
+                print(f"Skip {branch}: PR already open")
+                continue
+
+            # 本文とラベルは dry-run では使わないのでここで組み立てる
+            pr_body = f"Closes #{issue_num}\n\n---\n\n{issue['body']}"
+            labels = issue.get("labels", [])
+            label_ids = [label_name_to_id[l] for l in labels if l in label_name_to_id]
+
+            branch_specs.append((branch, issue_num))
+            pending.append((branch, title, pr_body, label_ids))
+
+        if branch_specs:
+            print(f"Creating {len(branch_specs)} branches...")
+            if not create_branches(branch_specs):
+                print("Error: branch creation failed", file=sys.stderr)
+                sys.exit(1)
+
+        # Phase 2: 一括 push → PR 作成だけを並列化
+        if pending:
+            branches = [branch for branch, _, _, _ in pending]
+            print(f"Pushing {len(branches)} branches...")
+            rejected = push_branches(branches)
+            if rejected is None:
+                sys.exit(1)
+            for branch in sorted(rejected):
+                print(f"  Push rejected: {branch}", file=sys.stderr)
+            pending = [p for p in pending if p[0] not in rejected]
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                futures = [
+                    executor.submit(
+                        create_pr_with_labels, client, repo_id,
+                        branch, title, pr_body, label_ids,
+                    )
+                    for branch, title, pr_body, label_ids in pending
+                ]
+                created = sum(1 for f in futures if f.result() is not None)
+
+    print(f"Done: {created} PRs created")
+
+
+if __name__ == "__main__":
+    main()
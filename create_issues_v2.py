@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Phase 0〜2 の Issue をまとめて作成するスクリプト (v2).
+
+gh issue create を 1 件ずつ subprocess で叩く代わりに、GraphQL の
+createIssue ミューテーションをエイリアスで束ねて 1 リクエストで送る。
+repositoryId とラベルは最初に 1 クエリで取得して使い回す。
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+try:
+    import httpx
+except ImportError:  # httpx がなければ gh CLI 経由にフォールバック
+    httpx = None
+
+from _gh_labels import ensure_labels
+from _issues_loader import load_issues
+
+OWNER = "rebuildup"
+REPO = "pomodoroom"
+GRAPHQL_URL = "https://api.github.com/graphql"
+BATCH_SIZE = 20  # 1 リクエストに束ねる createIssue の数
+RATE_LIMIT_FLOOR = 100  # 残りがこれを切ったらリセットまで待つ
+
+REPO_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100) { nodes { id name } }
+  }
+}
+"""
+
+# Issue の定義は issues_v2.json に一本化した (v3 と共通)
+issues = load_issues()
+
+
+class _GhCliResponse:
+    def __init__(self, result):
+        self._result = result
+        self.status_code = 200 if result.returncode == 0 else 500
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self._result.returncode != 0:
+            raise RuntimeError(f"gh api failed: {self._result.stderr.strip()}")
+
+    def json(self):
+        return json.loads(self._result.stdout)
+
+
+class GhCliClient:
+    """httpx がない環境向けの最小互換クライアント.
+
+    GraphQL ドキュメントを stdin から gh api graphql --input - に流す。
+    gh は 1 プロセス 1 リクエストしか受けないので完全な常駐にはできないが、
+    ミューテーションはバッチ化済みなので gh の起動は Issue 約 BATCH_SIZE 件
+    あたり 1 回で済む。認証は gh 自身に任せる。
+    """
+
+    def post(self, url, **kwargs):
+        result = subprocess.run(
+            ["gh", "api", "graphql", "--input", "-"],
+            input=json.dumps(kwargs["json"]),
+            capture_output=True, text=True, encoding="utf-8",
+        )
+        return _GhCliResponse(result)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def rate_limit_wait(headers):
+    """残量が閾値を切っていたらリセットまでの待ち時間 (秒) を返す."""
+    remaining = int(headers.get("X-RateLimit-Remaining", "1000"))
+    if remaining >= RATE_LIMIT_FLOOR:
+        return 0
+    reset = int(headers.get("X-RateLimit-Reset", "0"))
+    return max(0, reset - int(time.time()))
+
+
+def gql(client, query, variables=None):
+    while True:
+        resp = client.post(GRAPHQL_URL, json={"query": query, "variables": variables or {}})
+        if resp.status_code in (403, 429):
+            # 二次レートリミット: Retry-After に従って同じリクエストをやり直す
+            time.sleep(int(resp.headers.get("Retry-After", "1")))
+            continue
+        resp.raise_for_status()
+        wait = rate_limit_wait(resp.headers)
+        if wait:
+            print(f"  Rate limit low, sleeping {wait}s")
+            time.sleep(wait)
+        payload = resp.json()
+        if payload.get("errors"):
+            print(f"GraphQL errors: {payload['errors']}", file=sys.stderr)
+            sys.exit(1)
+        return payload["data"]
+
+
+def create_issues(client, repo_id, label_name_to_id):
+    created = []
+    for start in range(0, len(issues), BATCH_SIZE):
+        batch = issues[start:start + BATCH_SIZE]
+        decls = []
+        fields = []
+        variables = {}
+        for i, issue in enumerate(batch):
+            label_ids = [
+                label_name_to_id[l]
+                for l in issue.get("labels", [])
+                if l in label_name_to_id
+            ]
+            decls.append(f"$i{i}: CreateIssueInput!")
+            fields.append(f"a{i}: createIssue(input: $i{i}) {{ issue {{ number url }} }}")
+            variables[f"i{i}"] = {
+                "repositoryId": repo_id,
+                "title": issue["title"],
+                "body": issue["body"],
+                "labelIds": label_ids,
+            }
+        doc = "mutation(%s) { %s }" % (", ".join(decls), " ".join(fields))
+        data = gql(client, doc, variables)
+        for i in range(len(batch)):
+            info = data[f"a{i}"]["issue"]
+            print(f"  Created #{info['number']}: {info['url']}")
+            created.append(info)
+    return created
+
+
+def main():
+    if httpx is not None:
+        token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+        if not token:
+            print("Error: GH_TOKEN が設定されていない", file=sys.stderr)
+            sys.exit(1)
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+        }
+        client_ctx = httpx.Client(http2=True, headers=headers, timeout=30.0)
+    else:
+        client_ctx = GhCliClient()
+
+    with client_ctx as client:
+        data = gql(client, REPO_QUERY, {"owner": OWNER, "name": REPO})
+        repo_id = data["repository"]["id"]
+        label_nodes = data["repository"]["labels"]["nodes"]
+        wanted = {l for issue in issues for l in issue.get("labels", [])}
+        label_name_to_id = ensure_labels(
+            client, repo_id, label_nodes, wanted, f"{OWNER}/{REPO}"
+        )
+        created = create_issues(client, repo_id, label_name_to_id)
+
+    print(f"Done: {len(created)} issues created")
+
+
+if __name__ == "__main__":
+    main()
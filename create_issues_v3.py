@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Issue をまとめて作成するスクリプト (v3, async REST 版).
+
+issues_v2.json を読み、REST の POST /repos/{owner}/{repo}/issues を
+asyncio + aiohttp で並列に叩く。同時実行数は Semaphore で 5 に制限し、
+403/429 のときだけ Retry-After に従って待つ。ラベル起因の 422 は
+ラベルなしで 1 回だけ作り直す。
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import aiohttp
+
+from _issues_loader import issues_by_phase, load_issues
+
+OWNER = "rebuildup"
+REPO = "pomodoroom"
+API_URL = f"https://api.github.com/repos/{OWNER}/{REPO}/issues"
+MAX_CONCURRENCY = 5
+RATE_LIMIT_FLOOR = 100  # 残りがこれを切ったらリセットまで待つ
+
+
+def rate_limit_wait(headers):
+    """残量が閾値を切っていたらリセットまでの待ち時間 (秒) を返す."""
+    remaining = int(headers.get("X-RateLimit-Remaining", "1000"))
+    if remaining >= RATE_LIMIT_FLOOR:
+        return 0
+    reset = int(headers.get("X-RateLimit-Reset", "0"))
+    return max(0, reset - int(time.time()))
+
+
+async def create_one(session, sem, issue):
+    payload = {
+        "title": issue["title"],
+        "body": issue["body"],
+        "labels": issue.get("labels", []),
+    }
+    async with sem:
+        while True:
+            async with session.post(API_URL, json=payload) as resp:
+                if resp.status in (403, 429):
+                    retry_after = int(resp.headers.get("Retry-After", "1"))
+                    await asyncio.sleep(retry_after)
+                    continue
+                if resp.status == 422 and "labels" in payload:
+                    # ラベルが存在しない場合はラベルなしで作り直す
+                    del payload["labels"]
+                    continue
+                wait = rate_limit_wait(resp.headers)
+                if wait:
+                    print(f"  Rate limit low, sleeping {wait}s")
+                    await asyncio.sleep(wait)
+                body = await resp.json()
+                if resp.status != 201:
+                    print(f"  Failed: {issue['title']}: {body}", file=sys.stderr)
+                    return None
+                print(f"  Created #{body['number']}: {body['html_url']}")
+                return body
+
+
+async def create_issues(issues, token):
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+    }
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    async with aiohttp.ClientSession(headers=headers) as session:
+        results = await asyncio.gather(
+            *[create_one(session, sem, issue) for issue in issues]
+        )
+    return [r for r in results if r is not None]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create issues from issues_v2.json")
+    parser.add_argument("--phase", type=int, help="phase-N ラベルの Issue だけ作成する")
+    args = parser.parse_args()
+
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if not token:
+        print("Error: GH_TOKEN が設定されていない", file=sys.stderr)
+        sys.exit(1)
+
+    if args.phase is not None:
+        issues = issues_by_phase().get(f"phase-{args.phase}", [])
+    else:
+        issues = load_issues()
+    if not issues:
+        print("No issues to create")
+        return
+
+    created = asyncio.run(create_issues(issues, token))
+    print(f"Done: {len(created)}/{len(issues)} issues created")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,38 @@
-import re
+import mmap
+from pathlib import Path
 
-with open('src/views/ShellView.tsx', 'r', encoding='utf-8') as f:
-    content = f.read()
+PATH = Path('src/views/ShellView.tsx')
 
-# パターンを探して置換
-pattern = r'(\t+\.sort\(\(a, b\) => \{\n\t+const aStart = getEffectiveStartTime\(a\) \|\| "";\n\t+const bStart = getEffectiveStartTime\(b\) \|\| "";\n\t+return aStart\.localeCompare\(bStart\);\n\t+\}\) as Task\[\];\n)(\t+\}, \[taskStore, currentTimeMs\]\);)'
+# todayTasks メモの締め (return filtered; + 依存配列の先頭) に束縛する。
+# 依存配列だけだと upcomingTasks 側の締めにも一致してしまい、filtered が
+# 存在しないスコープを壊すので、return filtered; まで含めて特定する
+ANCHOR = b'return filtered;\n\t}, [taskStore, currentTimeMs'
+# 挿入するのはデバッグ行のみ (return filtered; は元からある)
+SNIPPET = (
+    b'console.debug("[todayTasks] Filtered tasks:", filtered.length, '
+    b'filtered.map(t => ({id: t.id, title: t.title, state: t.state, '
+    b'startedAt: t.startedAt, estimatedStartAt: t.estimatedStartAt})));\n'
+    b'\t\t'
+)
+# 挿入済み判定はアンカー直前のこの範囲だけ見れば足りる
+PATCH_CHECK_WINDOW = 2048
 
-def replacer(m):
-    indent = m.group(2)
-    return m.group(1) + f'{indent}\n{indent}console.debug("[todayTasks] Filtered tasks:", filtered.length, filtered.map(t => ({{id: t.id, title: t.title, state: t.state, startedAt: t.startedAt, estimatedStartAt: t.estimatedStartAt}})));\n{indent}return filtered;\n' + m.group(2)
+# mmap 上のバイト検索だけで「やることがあるか」を判定し、
+# 書き換えが必要なときだけファイル全体を取り込む (デコードは不要)
+with PATH.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    # アンカーは return filtered; まで含むので todayTasks メモにしか現れない
+    idx = mm.find(ANCHOR)
+    patched = (
+        idx >= 0
+        and b'console.debug("[todayTasks]' in mm[max(0, idx - PATCH_CHECK_WINDOW):idx]
+    )
+    content = bytes(mm) if idx >= 0 and not patched else None
 
-new_content = re.sub(pattern, replacer, content)
-
-if new_content != content:
-    with open('src/views/ShellView.tsx', 'w', encoding='utf-8') as f:
-        f.write(new_content)
-    print('Fixed!')
+if idx < 0:
+    print('Not found')
+elif patched:
+    # すでに挿入済みなら何もしない (再実行しても二重挿入されない)
+    print('Already patched')
 else:
-    print('Pattern not found, trying simpler approach...')
-    # 単純な文字列置換を試す
-    old = '}) as Task[];\n\t\t}, [taskStore, currentTimeMs]);'
-    new = '}) as Task[];\n\t\t\n\t\tconsole.debug("[todayTasks] Filtered tasks:", filtered.length, filtered.map(t => ({id: t.id, title: t.title, state: t.state, startedAt: t.startedAt, estimatedStartAt: t.estimatedStartAt})));\n\t\treturn filtered;\n\t\t}, [taskStore, currentTimeMs]);'
-    if old in content:
-        content = content.replace(old, new, 1)
-        with open('src/views/ShellView.tsx', 'w', encoding='utf-8') as f:
-            f.write(content)
-        print('Fixed with simple approach!')
-    else:
-        print('Not found')
+    PATH.write_bytes(content[:idx] + SNIPPET + content[idx:])
+    print('Fixed!')
@@ -1,40 +1,57 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-with open('src/components/m3/GuidanceBoard.tsx', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+import mmap
+from pathlib import Path
 
-# Lines are 0-indexed, so line 551 is index 550
-# Replace lines 550-576 (button wrapper) with div wrapper
-new_lines = lines[:550]  # Before the button
+PATH = Path('src/components/m3/GuidanceBoard.tsx')
 
-# Add div wrapper (simpler version)
-new_lines.append('\t\t\t\t\t\t\t\t<div className="h-full min-h-0 overflow-hidden w-full">\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t<div className="flex h-full items-stretch gap-2 overflow-x-auto overflow-y-hidden scrollbar-hover-x">\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t{nextTasks.slice(0, 3).map((task) => (\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t<button\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t\tkey={task.id}\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t\ttype="button"\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t\tclassName="flex-shrink-0 w-56 h-full bg-transparent border-0 p-0 cursor-pointer text-left"\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t\tonClick={() => {\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t\t\tsetSelectedNextTaskId(task.id);\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t\t\tsetIsNextControlMode(true);\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t\t}}\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t>\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t\t<GuidanceSimpleTaskCard\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t\t\ttask={task}\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t\t\tallTasks={nextTasks}\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t\t\tclassName="h-full"\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t\t/>\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t\t</button>\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t\t))}\n')
-new_lines.append('\t\t\t\t\t\t\t\t\t</div>\n')
-new_lines.append('\t\t\t\t\t\t\t\t</div>\n')
+# 置換後のブロック: ネストした button を div ラッパー + カードごとの button に直した形
+TEMPLATE = (
+    '\t\t\t\t\t\t\t\t<div className="h-full min-h-0 overflow-hidden w-full">\n'
+    '\t\t\t\t\t\t\t\t\t<div className="flex h-full items-stretch gap-2 overflow-x-auto overflow-y-hidden scrollbar-hover-x">\n'
+    '\t\t\t\t\t\t\t\t\t\t{nextTasks.map((task) => (\n'
+    '\t\t\t\t\t\t\t\t\t\t\t<button\n'
+    '\t\t\t\t\t\t\t\t\t\t\t\tkey={task.id}\n'
+    '\t\t\t\t\t\t\t\t\t\t\t\ttype="button"\n'
+    '\t\t\t\t\t\t\t\t\t\t\t\tclassName="flex-shrink-0 w-56 h-full bg-transparent border-0 p-0 cursor-pointer text-left"\n'
+    '\t\t\t\t\t\t\t\t\t\t\t\tonClick={() => {\n'
+    '\t\t\t\t\t\t\t\t\t\t\t\t\tsetSelectedNextTaskId(task.id);\n'
+    '\t\t\t\t\t\t\t\t\t\t\t\t\tsetIsNextControlMode(true);\n'
+    '\t\t\t\t\t\t\t\t\t\t\t\t}}\n'
+    '\t\t\t\t\t\t\t\t\t\t\t>\n'
+    '\t\t\t\t\t\t\t\t\t\t\t\t<GuidanceSimpleTaskCard\n'
+    '\t\t\t\t\t\t\t\t\t\t\t\t\ttask={task}\n'
+    '\t\t\t\t\t\t\t\t\t\t\t\t\tallTasks={nextTasks}\n'
+    '\t\t\t\t\t\t\t\t\t\t\t\t\tclassName="h-full"\n'
+    '\t\t\t\t\t\t\t\t\t\t\t\t/>\n'
+    '\t\t\t\t\t\t\t\t\t\t\t</button>\n'
+    '\t\t\t\t\t\t\t\t\t\t))}\n'
+    '\t\t\t\t\t\t\t\t\t</div>\n'
+    '\t\t\t\t\t\t\t\t</div>\n'
+)
 
-# Add remaining lines after the button (starting from line 578 which is index 577)
-new_lines.extend(lines[577:])
+# 行番号ではなくアンカー文字列で置換範囲を特定する (上流の行ズレに強い)
+TEMPLATE_B = TEMPLATE.encode('utf-8')
+START_ANCHOR = TEMPLATE_B[:TEMPLATE_B.index(b'\n')]
+END_ANCHOR = b'\n\t\t\t\t\t\t\t\t</div>\n'
 
-with open('src/components/m3/GuidanceBoard.tsx', 'w', encoding='utf-8') as f:
-    f.writelines(new_lines)
+# mmap 上のバイト検索で置換範囲を探し、修正済みならデコードも書き込みもしない
+# (エディタのリロードや git status を汚さない)
+with PATH.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    start = mm.find(START_ANCHOR)
+    if start < 0:
+        print('Anchor not found in GuidanceBoard.tsx')
+        raise SystemExit(1)
+    end = mm.find(END_ANCHOR, start)
+    if end < 0:
+        print('Closing anchor not found in GuidanceBoard.tsx')
+        raise SystemExit(1)
+    end += len(END_ANCHOR)
+    if mm[start:end] == TEMPLATE_B:
+        print('Already fixed, nothing to write')
+        raise SystemExit(0)
+    src = bytes(mm)
 
+PATH.write_bytes(src[:start] + TEMPLATE_B + src[end:])
 print('Fixed nested buttons in GuidanceBoard.tsx')